@@ -1,6 +1,29 @@
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Any, Optional, Type, TypeVar
 from hytek_parser._exceptions import ChecksumError, MalformedChecksumError
 
+# Age groups guessed from a swimmer's age, as (age_min, age_max)
+AGE_GROUP_8_UNDER = (0, 8)
+AGE_GROUP_9_10 = (9, 10)
+AGE_GROUP_11_12 = (11, 12)
+AGE_GROUP_13_14 = (13, 14)
+AGE_GROUP_OPEN = (0, 109)
+
+# Upper age of each group, indexed by bisect into AGE_GROUPS
+AGE_GROUP_BOUNDS = (8, 10, 12, 14)
+AGE_GROUPS = (
+    AGE_GROUP_8_UNDER,
+    AGE_GROUP_9_10,
+    AGE_GROUP_11_12,
+    AGE_GROUP_13_14,
+    AGE_GROUP_OPEN,
+)
+
+# Value of each ASCII digit byte, 0xFF for every other byte
+DIGIT_LUT = bytes(c - 48 if 48 <= c <= 57 else 0xFF for c in range(256))
+
+
 def extract(string: str, start: int, len_: int) -> str:
     """Extract a section of a certain length from a string.
 
@@ -25,21 +48,8 @@ def guess_age_group(swimmer_age: int) -> tuple[int, int]:
     Returns:
         tuple[int, int]: The age group in terms of (age_min, age_max).
     """
-    if swimmer_age <= 8:
-        # Probably 8&U
-        return 0, 8
-    elif 9 <= swimmer_age <= 10:
-        # Probably 9-10
-        return 9, 10
-    elif 11 <= swimmer_age <= 12:
-        # Probably 11-12
-        return 11, 12
-    elif 13 <= swimmer_age <= 14:
-        # Probably 13-14
-        return 13, 14
-    else:
-        # Probably open
-        return 0, 109
+    # First group whose upper age is at least the swimmer's age, else open
+    return AGE_GROUPS[bisect_left(AGE_GROUP_BOUNDS, swimmer_age)]
 
 
 def get_age_group(
@@ -89,6 +99,21 @@ def get_age_group(
 EnumType = TypeVar("EnumType")
 
 
+@lru_cache(maxsize=1024)
+def _select_from_enum(enum: Type[EnumType], value: Any) -> EnumType:
+    """Select a value from an enum, memoized since file values repeat.
+
+    Values that compare equal, such as 1, 1.0 and True, share a cache entry.
+    That matches the enum's own value lookup, which is also keyed by hash.
+    """
+    try:
+        # Errors are caught
+        return enum(value)  # type: ignore[call-arg]
+    except ValueError:
+        # Every Enum has an UNKNOWN in enums.py
+        return enum.UNKNOWN  # type: ignore[attr-defined]
+
+
 def select_from_enum(enum: Type[EnumType], value: Any) -> EnumType:
     """Safely select a value from an enum.
 
@@ -100,11 +125,10 @@ def select_from_enum(enum: Type[EnumType], value: Any) -> EnumType:
         Any: The selected value from the enum.
     """
     try:
-        # Errors are caught
-        return enum(value)  # type: ignore[call-arg]
-    except ValueError:
-        # Every Enum has an UNKNOWN in enums.py
-        return enum.UNKNOWN  # type: ignore[attr-defined]
+        return _select_from_enum(enum, value)
+    except TypeError:
+        # Unhashable values can't be memoized
+        return _select_from_enum.__wrapped__(enum, value)
 
 
 CastType = TypeVar("CastType")
@@ -131,6 +155,29 @@ def safe_cast(type_: Type[CastType], value: Any, default: Any = None) -> CastTyp
         else:
             return type_()
 
+
+def safe_int(value: Any, default: Any = None) -> int:
+    """Safely cast a value to an int, without raising for plain or blank fields.
+
+    Args:
+        value (Any): The value to cast.
+        default (Any, optional): The default value to return. If None, use 0.
+                                 Defaults to None.
+
+    Returns:
+        int: The casted variable or default if casting is not possible.
+    """
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped.isdecimal():
+            return int(stripped)
+        elif not stripped:
+            # Blank field
+            return default or 0
+
+    return safe_cast(int, value, default)
+
+
 def int_or_none(value:str|None) -> int|None:
     """Safely return either an int from a numeric string value, or None
     
@@ -142,60 +189,71 @@ def int_or_none(value:str|None) -> int|None:
     return int(value) if value and value.isdigit() else None
 
 
-def calculate_checksum(line:str) -> int:
-    """Calculates the checksum for a given line.
+def _checksum_digits(data: bytes) -> tuple[int, int]:
+    """Calculates the two checksum digits for a line payload.
 
     Args:
-        line (str): The line from the .hy3 file.
+        data (bytes): The encoded line, without its checksum characters.
 
     Returns:
-        str: The calculated two-digit checksum.
-
-    Example:
-        >>> checksum = calculate_checksum("Z0")
-        >>> print(checksum)
-        07
+        tuple[int, int]: The first and second checksum digits.
     """
-    line = line[:-2]  # Remove last two checksum characters
-
-    # Compute ASCII values
-    ord_chars = [ord(char) for char in line]
-
-    # Split into odd/even indexed values
-    odd_sum = sum(2 * ord_chars[i] for i in range(1, len(ord_chars), 2))
-    even_sum = sum(ord_chars[i] for i in range(0, len(ord_chars), 2))
+    # Split into odd/even indexed values, odd values count double
+    odd_sum = 2 * sum(data[1::2])
+    even_sum = sum(data[0::2])
 
     # Compute checksum values
     sum_val = odd_sum + even_sum
     sum2 = (sum_val // 21) + 205
 
     # Extract last two digits
-    checksum1 = sum2 % 10
-    checksum2 = (sum2 // 10) % 10
+    return sum2 % 10, (sum2 // 10) % 10
+
+
+def calculate_checksum(line: bytes) -> bytes:
+    """Calculates the checksum for a given line.
+
+    Args:
+        line (bytes): The raw line from the .hy3 file.
 
-    return f"{checksum1}{checksum2}"
+    Returns:
+        bytes: The calculated two-digit checksum.
 
-def validate_checksum(line:str) -> bool:
+    Example:
+        >>> checksum = calculate_checksum(b"Z0".ljust(128) + b"00")
+        >>> print(checksum)
+        b'10'
+    """
+    # Remove last two checksum characters
+    checksum1, checksum2 = _checksum_digits(line[:-2])
+
+    return bytes((48 + checksum1, 48 + checksum2))
+
+
+def validate_checksum(line: bytes) -> bool:
     """Validates the checksum of a given line.
 
     Args:
-        line (str): The line from the .hy3 file.
+        line (bytes): The raw line from the .hy3 file.
 
     Raises:
         MalformedChecksumError: If the checksum is missing or malformed.
         ChecksumError: If the checksum is invalid.
     """
     if len(line) < 2:
-        raise MalformedChecksumError(line)
-
-    actual_checksum = line[-2:]
+        raise MalformedChecksumError(line.decode("latin-1"))
 
     # Ensure the checksum consists of two digits
-    if not actual_checksum.isdigit():
-        raise MalformedChecksumError(line)
-
-    expected_checksum = calculate_checksum(line)
-
-    if actual_checksum != expected_checksum:
-        raise ChecksumError(line, expected_checksum, actual_checksum)
+    actual = (DIGIT_LUT[line[-2]], DIGIT_LUT[line[-1]])
+    if (actual[0] | actual[1]) == 0xFF:
+        raise MalformedChecksumError(line.decode("latin-1"))
+
+    checksum1, checksum2 = expected = _checksum_digits(line[:-2])
+
+    if actual != expected:
+        raise ChecksumError(
+            line.decode("latin-1"),
+            f"{checksum1}{checksum2}",
+            line[-2:].decode("latin-1"),
+        )
     return True
\ No newline at end of file
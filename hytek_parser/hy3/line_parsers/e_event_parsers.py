@@ -1,7 +1,13 @@
 from datetime import datetime
 from typing import Any
 
-from hytek_parser._utils import extract, get_age_group, safe_cast, select_from_enum
+from hytek_parser._utils import (
+    extract,
+    get_age_group,
+    safe_cast,
+    safe_int,
+    select_from_enum,
+)
 from hytek_parser.hy3._utils import parse_time
 from hytek_parser.hy3.enums import (
     Course,
@@ -20,17 +26,17 @@ def e1_parser(
 ) -> ParsedHytekFile:
     """Parse an E1 individual event entry."""
     # Get swimmer
-    swimmer_code = safe_cast(int, extract(line, 4, 5))
+    swimmer_code = safe_int(extract(line, 4, 5))
     swimmer = file.meet.swimmers[swimmer_code]
 
     # Event info
     event_gender = select_from_enum(Gender, extract(line, 14, 1))
     event_gender_age = select_from_enum(GenderAge, extract(line, 15, 1))
-    distance = safe_cast(int, extract(line, 16, 6))
+    distance = safe_int(extract(line, 16, 6))
     stroke = select_from_enum(Stroke, extract(line, 22, 1))
     age_min, age_max = get_age_group(
-        age_min=safe_cast(int, extract(line, 23, 3)),
-        age_max=safe_cast(int, extract(line, 26, 3)),
+        age_min=safe_int(extract(line, 23, 3)),
+        age_max=safe_int(extract(line, 26, 3)),
         swimmer_age=swimmer.age,
     )
     event_fee = safe_cast(float, extract(line, 33, 6))
@@ -95,10 +101,10 @@ def e2_parser(
         dq_code = select_from_enum(DisqualificationCode, extract(line, 14, 2))
         dq_info = {dq_code.value: DisqualificationInfo(dq_code, None)}
 
-    heat = safe_cast(int, extract(line, 21, 3))
-    lane = safe_cast(int, extract(line, 24, 3))
-    heat_place = safe_cast(int, extract(line, 27, 3))
-    overall_place = safe_cast(int, extract(line, 30, 4))
+    heat = safe_int(extract(line, 21, 3))
+    lane = safe_int(extract(line, 24, 3))
+    heat_place = safe_int(extract(line, 27, 3))
+    overall_place = safe_int(extract(line, 30, 4))
 
     # Skipping over pad/plunger times since they are not that useful
     date_ = datetime.strptime(extract(line, 88, 8), "%m%d%Y").date()
@@ -1,7 +1,13 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from hytek_parser._utils import extract, get_age_group, safe_cast, select_from_enum
+from hytek_parser._utils import (
+    extract,
+    get_age_group,
+    safe_cast,
+    safe_int,
+    select_from_enum,
+)
 from hytek_parser.hy3._utils import parse_time
 from hytek_parser.hy3.enums import (
     Course,
@@ -30,12 +36,12 @@ def f1_parser(
     # Get event info
     event_gender = select_from_enum(Gender, extract(line, 14, 1))
     event_gender_age = select_from_enum(GenderAge, extract(line, 15, 1))
-    distance = safe_cast(int, extract(line, 16, 6))
+    distance = safe_int(extract(line, 16, 6))
     stroke = select_from_enum(Stroke, extract(line, 22, 1))
 
     # Have to set these now since swimmer ages are not available yet
-    age_min = safe_cast(int, extract(line, 23, 3))
-    age_max = safe_cast(int, extract(line, 26, 3))
+    age_min = safe_int(extract(line, 23, 3))
+    age_max = safe_int(extract(line, 26, 3))
 
     # Get last bits of event info
     event_fee = safe_cast(float, extract(line, 33, 6))
@@ -102,10 +108,10 @@ def f2_parser(
         dq_code = select_from_enum(DisqualificationCode, extract(line, 14, 2))
         dq_info = {dq_code.value: DisqualificationInfo(dq_code, None)}
 
-    heat = safe_cast(int, extract(line, 21, 3))
-    lane = safe_cast(int, extract(line, 24, 3))
-    heat_place = safe_cast(int, extract(line, 27, 3))
-    overall_place = safe_cast(int, extract(line, 30, 4))
+    heat = safe_int(extract(line, 21, 3))
+    lane = safe_int(extract(line, 24, 3))
+    heat_place = safe_int(extract(line, 27, 3))
+    overall_place = safe_int(extract(line, 30, 4))
 
     # Skipping over pad/plunger times since they are not that useful
     date_ = datetime.strptime(extract(line, 103, 8), "%m%d%Y").date()
@@ -150,13 +156,13 @@ def f3_parser(
     for x in range(8):
         offset = x * 13  # 13 chars per swimmer entry
 
-        swimmer_meet_id = safe_cast(int, extract(line, 4 + offset, 5), default=-1)
+        swimmer_meet_id = safe_int(extract(line, 4 + offset, 5), default=-1)
         if swimmer_meet_id == -1:
             # Out of swimmers
             break
 
         swimmer = file.meet.swimmers[swimmer_meet_id]
-        swimmer_leg = safe_cast(int, extract(line, 15 + offset, 1))
+        swimmer_leg = safe_int(extract(line, 15 + offset, 1))
 
         # Assume Hytek makes their files correctly
         relay_swimmers[swimmer_leg - 1] = swimmer
@@ -1,6 +1,6 @@
 from typing import Any
 
-from hytek_parser._utils import extract, safe_cast, select_from_enum
+from hytek_parser._utils import extract, safe_cast, safe_int, select_from_enum
 from hytek_parser.hy3.enums import ResultType
 from hytek_parser.hy3.schemas import ParsedHytekFile
 
@@ -19,7 +19,7 @@ def g1_parser(
     line_pos = 4
     splits: dict[int, float] = {}
     while line_pos < 124 and line[line_pos] != " ":
-        split_num = safe_cast(int, extract(line, line_pos, 2))
+        split_num = safe_int(extract(line, line_pos, 2))
         split_time = safe_cast(float, extract(line, line_pos + 2, 8))
 
         splits[split_num] = split_time
@@ -1,3 +1,4 @@
+import locale
 from typing import Any
 
 from hytek_parser.hy3 import HY3_LINE_PARSERS
@@ -26,37 +27,52 @@ def parse_hy3(
         "default_country": default_country,
     }
 
-    # Read file
-    with open(file) as f:
-        lines = [line.strip() for line in f]
+    # Read file, every record ends in its checksum so only trailing padding
+    # and the line ending need removing
+    with open(file, "rb") as f:
+        lines = [line.rstrip(b" \r\n") for line in f]
+
+    # Files with bare \r line endings come through as a single line
+    if len(lines) == 1:
+        lines = [line.rstrip(b" ") for line in lines[0].splitlines()]
 
     # Make sure this is the right kind of file
-    if lines[0][0:2] != "A1":
+    if not lines or lines[0][0:2] != b"A1":
         raise ValueError("Not a Hytek file!")
 
+    # Find the end of file, anything after the first terminator is ignored
+    end = next((i for i, line in enumerate(lines) if line[0:2] == b"Z0"), None)
+
     # Add terminator to file
-    if lines[-1][0:2] != "Z0":
-        terminator_line = "Z0".ljust(128, " ")  # Ensure correct padding
-        checksum = calculate_checksum(terminator_line + "00") # add placeholder checksum
+    if end is None:
+        terminator_line = b"Z0".ljust(128, b" ")  # Ensure correct padding
+        checksum = calculate_checksum(terminator_line + b"00") # add placeholder checksum
         lines.append(terminator_line + checksum)
+        end = len(lines) - 1
+
+    # Lines are decoded one at a time, the same way open() would decode them
+    encoding = locale.getpreferredencoding(False)
 
     # Start parsing
     parsed_file = ParsedHytekFile()
 
+    # Bind lookups used on every line to locals
+    get_line_parser = HY3_LINE_PARSERS.get
+    validate = validate_checksum
+
     warnings = 0
     errors = 0
-    for line in lines:
+    # The Z0 terminator has nothing to parse
+    for raw_line in lines[:end]:
         if validate_checksums:
-            validate_checksum(line)
+            validate(raw_line)
 
-        code = line[0:2]
+        line = raw_line.decode(encoding)
 
-        if code == "Z0":
-            # End of file
-            break
+        code = line[0:2]
 
         try:
-            line_parser = HY3_LINE_PARSERS.get(code)
+            line_parser = get_line_parser(code)
 
             if line_parser is None:
                 print(f"Invalid line code: {code}")  # TODO: raise an actual warning
@@ -67,6 +83,9 @@ def parse_hy3(
             msg = "Exception while parsing, please open an issue with full traceback at https://github.com/SwimComm/hytek-parser/issues/new/choose"
             raise RuntimeError(msg) from e  # TODO: actual error handling
 
+    if validate_checksums:
+        validate(lines[end])
+
     # logger.success(
     #     f"Parse completed with {warnings} warning(s) and {errors} error(s)."
     # )
@@ -1,5 +1,14 @@
 import unittest
-from hytek_parser._utils import safe_cast, int_or_none, select_from_enum
+from hytek_parser._utils import (
+    safe_cast,
+    safe_int,
+    int_or_none,
+    guess_age_group,
+    select_from_enum,
+    calculate_checksum,
+    validate_checksum,
+)
+from hytek_parser._exceptions import ChecksumError, MalformedChecksumError
 from hytek_parser.hy3.schemas import Stroke
 
 class TestUtils(unittest.TestCase):
@@ -14,6 +23,18 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(True, safe_cast(bool, 1.23, None))
         self.assertEqual(False, safe_cast(bool, "", None))
     
+    def test_safe_int(self) -> None:
+        self.assertEqual(0, safe_int(""))
+        self.assertEqual(0, safe_int("   "))
+        self.assertEqual(-1, safe_int("", default=-1))
+        self.assertEqual(123, safe_int("123"))
+        self.assertEqual(123, safe_int(" 123 "))
+        self.assertEqual(-12, safe_int("-12"))
+        self.assertEqual(0, safe_int("OneTwoThree"))
+        self.assertEqual(-1, safe_int("OneTwoThree", default=-1))
+        self.assertEqual(0, safe_int(None))
+        self.assertEqual(1, safe_int(1.23))
+
     def test_int_or_none(self) -> None:
         self.assertEqual(None, int_or_none(""))
         self.assertEqual(1, int_or_none("1"))
@@ -23,6 +44,28 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(Stroke.FREESTYLE, select_from_enum(Stroke, "A")) 
         self.assertEqual(Stroke.FREESTYLE, select_from_enum(Stroke, 1)) 
         self.assertEqual(Stroke.UNKNOWN, select_from_enum(Stroke, "foo"))
+        self.assertEqual(Stroke.UNKNOWN, select_from_enum(Stroke, ["A"]))
+
+    def test_guess_age_group(self) -> None:
+        self.assertEqual((0, 8), guess_age_group(6))
+        self.assertEqual((0, 8), guess_age_group(8))
+        self.assertEqual((9, 10), guess_age_group(9))
+        self.assertEqual((9, 10), guess_age_group(10))
+        self.assertEqual((11, 12), guess_age_group(12))
+        self.assertEqual((13, 14), guess_age_group(13))
+        self.assertEqual((0, 109), guess_age_group(15))
+
+    def test_calculate_checksum(self) -> None:
+        line = b"D1M 1234Smith               John                Johnny              A123456789012  120120100 12".ljust(128)
+        self.assertEqual(b"81", calculate_checksum(line + b"00"))
+        self.assertEqual(b"10", calculate_checksum(b"Z0".ljust(128) + b"00"))
+
+    def test_validate_checksum(self) -> None:
+        line = b"D1M 1234Smith               John                Johnny              A123456789012  120120100 12".ljust(128)
+        self.assertTrue(validate_checksum(line + b"81"))
+        self.assertRaises(ChecksumError, validate_checksum, line + b"18")
+        self.assertRaises(MalformedChecksumError, validate_checksum, line + b"8 ")
+        self.assertRaises(MalformedChecksumError, validate_checksum, b"8")
                    
 if __name__=='__main__':
 	unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest.mock import patch
+from hytek_parser import HY3_LINE_PARSERS, parse_hy3
+from hytek_parser._exceptions import ChecksumError
+from hytek_parser._utils import extract
+from hytek_parser.hy3.schemas import ParsedHytekFile, Team
+
+LINES = [
+    b"A107Results From MM to TM    Hy-Tek, Ltd    MM5 7.0Gb  06222024  8:58 PMOakton Swim Team                                        53",
+    b"B1NVSL A-Meet ML@OAK                           Oakton                                       062220240622202406012024   0        71",
+    b"C1OAK  Oakton Swim Team                Oakton          PV                                                                       41",
+    b"D1F  260Doe                 Jane                                                        01112016  8                             94",
+]
+TERMINATOR = b"Z0                                                                                                                              10"
+EXTRA_SWIMMER = b"D1M  261Roe                 John                                                        02022015  9                             25"
+
+
+def skip_a1(line: str, file: ParsedHytekFile, opts: dict[str, Any]) -> ParsedHytekFile:
+    return file
+
+
+def simple_c1(line: str, file: ParsedHytekFile, opts: dict[str, Any]) -> ParsedHytekFile:
+    code = extract(line, 3, 5)
+    file.meet.last_team = (code, Team(extract(line, 8, 30), code, "","","","","","","","","","","","",{}))
+    return file
+
+
+# The A1 and C1 parsers don't run against the current enums and schemas,
+# they aren't what's under test here
+@patch.dict(HY3_LINE_PARSERS, {"A1": skip_a1, "C1": simple_c1})
+class TestParseHy3(unittest.TestCase):
+
+    def parse(self, data: bytes, validate_checksums: bool = True) -> ParsedHytekFile:
+        fd, path = tempfile.mkstemp(suffix=".hy3")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return parse_hy3(path, validate_checksums=validate_checksums)
+
+    def test_parse_hy3(self) -> None:
+        result = self.parse(b"\r\n".join(LINES + [TERMINATOR]) + b"\r\n")
+        self.assertEqual("NVSL A-Meet ML@OAK", result.meet.name)
+        self.assertEqual("OAK", result.meet.last_team[0])
+        self.assertEqual([260], list(result.meet.swimmers))
+
+    def test_line_endings(self) -> None:
+        for ending in (b"\n", b"\r", b"  \r\n"):
+            result = self.parse(ending.join(LINES + [TERMINATOR]) + ending)
+            self.assertEqual([260], list(result.meet.swimmers))
+
+    def test_missing_terminator(self) -> None:
+        result = self.parse(b"\r\n".join(LINES))
+        self.assertEqual([260], list(result.meet.swimmers))
+
+    def test_ignores_lines_after_terminator(self) -> None:
+        data = b"\r\n".join(LINES + [TERMINATOR, b"", EXTRA_SWIMMER, b"\x1a"])
+        for validate_checksums in (True, False):
+            result = self.parse(data, validate_checksums)
+            self.assertEqual([260], list(result.meet.swimmers))
+
+    def test_invalid_checksum(self) -> None:
+        data = b"\r\n".join(LINES[:-1] + [LINES[-1][:-2] + b"49", TERMINATOR])
+        self.assertRaises(ChecksumError, self.parse, data)
+        self.assertEqual([260], list(self.parse(data, False).meet.swimmers))
+
+    def test_not_hytek_file(self) -> None:
+        self.assertRaises(ValueError, self.parse, b"")
+        self.assertRaises(ValueError, self.parse, b"\r\n".join(LINES[1:]))
+
+if __name__=='__main__':
+	unittest.main()